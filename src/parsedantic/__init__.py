@@ -8,36 +8,61 @@ surface includes the core :class:`ParsableModel` base class, the
 :class:`ParseError` type used for parse failures, the :class:`ParseField`
 helper for per-field parser customisation, configuration helpers, and the
 primitive parser builder functions.
+
+Public names are resolved lazily (PEP 562): ``from parsedantic import integer``
+only imports :mod:`parsedantic.parsers`, not the model and generator machinery.
 """
 
-from .errors import ParseError
-from .models import ParsableModel
-from .fields import ParseField
-from .config import ParseConfig
-from .builder import parser_builder
-from .generator import build_model_parser, generate_field_parser
-from .parsers import (
-    any_char,
-    float_num,
-    integer,
-    literal,
-    pattern,
-    whitespace,
-    word,
-)
-
-__all__: list[str] = [
-    "ParsableModel",
-    "ParseError",
-    "ParseField",
-    "ParseConfig",
-    "build_model_parser",
-    "generate_field_parser",
-    "literal",
-    "pattern",
-    "integer",
-    "float_num",
-    "word",
-    "whitespace",
-    "any_char",
-]
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:  # pragma: no cover - import only for typing
+    from .builder import parser_builder  # noqa: F401
+    from .config import ParseConfig  # noqa: F401
+    from .errors import ParseError  # noqa: F401
+    from .fields import ParseField  # noqa: F401
+    from .generator import build_model_parser, generate_field_parser  # noqa: F401
+    from .models import ParsableModel  # noqa: F401
+    from .parsers import (  # noqa: F401
+        any_char,
+        float_num,
+        integer,
+        literal,
+        pattern,
+        whitespace,
+        word,
+    )
+
+# Public name -> defining submodule; the single source for ``__all__``.
+_EXPORTS: Dict[str, str] = {
+    "ParsableModel": ".models",
+    "ParseError": ".errors",
+    "ParseField": ".fields",
+    "ParseConfig": ".config",
+    "parser_builder": ".builder",
+    "build_model_parser": ".generator",
+    "generate_field_parser": ".generator",
+    "literal": ".parsers",
+    "pattern": ".parsers",
+    "integer": ".parsers",
+    "float_num": ".parsers",
+    "word": ".parsers",
+    "whitespace": ".parsers",
+    "any_char": ".parsers",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining *name* on first access and cache it."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
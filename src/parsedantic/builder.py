@@ -51,13 +51,13 @@ def _wrap_generator_function(func: Callable[..., Any]) -> Callable[..., Parser[A
 
     @wraps(func)
     def factory(*args: Any, **kwargs: Any) -> Parser[Any]:
-        @generate
-        def parser() -> Any:
-            # Delegate the generator protocol to the user function.
-            result = yield from func(*args, **kwargs)
-            return result
+        # Hand parsy the user's generator directly rather than re-yielding it
+        # from a wrapper generator, which would add a frame to every step.
+        @wraps(func)
+        def start() -> Any:
+            return func(*args, **kwargs)
 
-        return parser
+        return generate(start)
 
     return factory
 
@@ -33,6 +33,11 @@ class ParseConfig:
     strict_optional: bool = True
     #: Optional whitespace parser that may be used between fields.
     whitespace: Parser | None = None
+    #: Memoize this model's parser per input position (packrat parsing). Only
+    #: pays off when the model is retried at the same position, e.g. as a
+    #: nested field shared by several ``Union`` alternatives. The memo lasts for
+    #: one :meth:`ParsableModel.parse` call.
+    packrat: bool = False
 
 
 def get_parse_config(model_class: type["ParsableModel"]) -> type[ParseConfig]:
@@ -11,11 +11,9 @@ The goal is to provide actionable, implementation-agnostic feedback to callers:
 they should never need to depend on parsy's own :class:`ParseError` type.
 """
 
-from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(slots=True, init=False)
 class ParseError(Exception):
     """Parsing failure with source position information.
 
@@ -23,24 +21,61 @@ class ParseError(Exception):
         text: Original input text that was being parsed.
         index: Zero-based character index where the error occurred.
         expected: Human readable description of what was expected.
-        line: One-based line number of the error location.
-        column: One-based column number of the error location.
+        line: One-based line number of the error location (computed lazily).
+        column: One-based column number of the error location (computed lazily).
     """
 
+    __slots__ = ("text", "index", "expected", "_position")
+
     text: str
     index: int
     expected: str
-    line: int
-    column: int
+    _position: tuple[int, int] | None
 
     def __init__(self, text: str, index: int, expected: str) -> None:
-        # Manual init so we can derive line/column eagerly.
+        # line/column are derived lazily on first access so that errors which
+        # are caught and never reported skip the newline scan.
         self.text = text
         self.index = index
         self.expected = expected
-        self.line, self.column = get_line_column(text, index)
+        self._position = None
         Exception.__init__(self)
 
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(text={self.text!r}, index={self.index!r}, "
+            f"expected={self.expected!r}, line={self.line!r}, "
+            f"column={self.column!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.text, self.index, self.expected) == (
+            other.text,  # type: ignore[attr-defined]
+            other.index,  # type: ignore[attr-defined]
+            other.expected,  # type: ignore[attr-defined]
+        )
+
+    # Equality is value-based, so instances are unhashable (as before).
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def line(self) -> int:
+        """One-based line number of the error location."""
+        return self._get_position()[0]
+
+    @property
+    def column(self) -> int:
+        """One-based column number of the error location."""
+        return self._get_position()[1]
+
+    def _get_position(self) -> tuple[int, int]:
+        position = self._position
+        if position is None:
+            position = self._position = get_line_column(self.text, self.index)
+        return position
+
     def __str__(self) -> str:  # pragma: no cover - behaviour tested via tests
         context_line = _get_context_line(self.text, self.line)
         marker_line = " " * (self.column - 1) + "^"
@@ -87,17 +122,18 @@ def get_line_column(text: str, index: int) -> tuple[int, int]:
     if index > len(text):
         index = len(text)
 
-    # Line number is count of preceding newlines + 1.
-    line = text.count("\n", 0, index) + 1
-
-    # Column is distance from most recent newline (or start of text) + 1.
+    # Find the most recent newline first: single-line inputs (the common case)
+    # then need no counting scan at all.
     last_newline = text.rfind("\n", 0, index)
     if last_newline == -1:
-        column = index + 1
-    else:
-        column = index - last_newline
-    if column <= 0:
-        column = 1
+        return 1, index + 1
+
+    # Line number is count of preceding newlines + 1. Newlines before the last
+    # one are counted up to it, and the last one itself adds one more line.
+    line = text.count("\n", 0, last_newline) + 2
+
+    # Column is distance from most recent newline + 1.
+    column = index - last_newline
     return line, column
 
 
@@ -16,7 +16,7 @@ from pydantic import Field as PydanticField
 from pydantic.fields import FieldInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseFieldMetadata:
     """Metadata attached to a Pydantic field by :func:`ParseField`.
 
@@ -37,21 +37,23 @@ def get_parsefield_metadata(field_info: FieldInfo) -> ParseFieldMetadata | None:
     ``json_schema_extra`` mapping of the underlying :class:`FieldInfo` object.
     This helper hides these storage details from the rest of the codebase.
     """
-    # First, look through the ``metadata`` attribute if it exists.
-    raw: Iterable[Any] | None = getattr(field_info, "metadata", None)
+    # ParseField stores its metadata under ``json_schema_extra["parsedantic"]``
+    # (Pydantic v2 keeps extra ``Field`` data there); check that first so that
+    # ParseField-configured fields resolve with a single dict lookup.
+    extra = field_info.json_schema_extra
+    if isinstance(extra, dict):
+        candidate = extra.get("parsedantic")
+        if isinstance(candidate, ParseFieldMetadata):
+            return candidate
+
+    # Plain fields carry neither, so the fallbacks below are skipped entirely.
+    raw: Iterable[Any] | None = field_info.metadata
     if raw:
         for item in raw:
             if isinstance(item, ParseFieldMetadata):
                 return item
 
-    # For Pydantic v2, extra data supplied to :func:`Field` is stored in
-    # ``json_schema_extra``. ParseField uses this to keep its metadata.
-    extra = getattr(field_info, "json_schema_extra", None)
     if isinstance(extra, dict):
-        candidate = extra.get("parsedantic")
-        if isinstance(candidate, ParseFieldMetadata):
-            return candidate
-
         # Support older storage under ``metadata`` for robustness.
         meta_value = extra.get("metadata")
         if isinstance(meta_value, ParseFieldMetadata):
@@ -15,7 +15,7 @@ from types import NoneType, UnionType
 from typing import (
     Any,
     Dict,
-    Iterable,
+    Iterator,
     List,
     Sequence,
     Tuple,
@@ -25,18 +25,22 @@ from typing import (
     ForwardRef,
     get_args,
     get_origin,
-    get_type_hints,  # <-- add this
+    get_type_hints,
 )
 
 import logging
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 
-from parsy import Parser, seq, success
+from parsy import Parser, Result, alt, seq, success
 from pydantic.fields import FieldInfo
 
 logger = logging.getLogger(__name__)
 
-from .parsers import float_num, integer, literal, pattern, whitespace
+from .parsers import _tag_regex, float_num, integer, literal, pattern, whitespace
+from .config import get_parse_config
 from .fields import get_parsefield_metadata
 
 
@@ -44,44 +48,99 @@ if TYPE_CHECKING:  # pragma: no cover - import only for typing
     from .models import ParsableModel
 
 
+# parsy parsers are immutable, so the default scalar parsers are built once and
+# shared by every field instead of being reconstructed per field.
+_STR_PARSER: Parser[str] = pattern(r"\S+")
+_INT_PARSER: Parser[int] = integer()
+_FLOAT_PARSER: Parser[float] = float_num()
+# Scalar annotation -> shared default parser. ``str`` fields next to a literal
+# separator are the exception and get a separator-aware parser instead.
+_TYPE_DISPATCH: Dict[Any, Parser[Any]] = {
+    str: _STR_PARSER,
+    int: _INT_PARSER,
+    float: _FLOAT_PARSER,
+}
+# Default separator between model fields and between list elements.
+_DEFAULT_SEPARATOR: Parser[str] = whitespace()
+# Consumes an unparseable token in place of a lenient ``Optional`` field.
+_GARBAGE_TOKEN: Parser[None] = _STR_PARSER.result(None)
+
+
 def _extract_literal_string(parser: Parser[Any]) -> str | None:
     """Extract the literal string from a literal() parser if possible."""
     # Check for the _literal_value attribute we set in parsers.literal()
     return getattr(parser, "_literal_value", None)
 
 
+@lru_cache(maxsize=64)
 def _build_string_parser(separator_chars: str | None = None) -> Parser[str]:
-    """Build a string parser that stops at whitespace and optional separator chars."""
+    """Build a string parser that stops at whitespace and optional separator chars.
+
+    Results are cached per separator, so every ``str`` field next to the same
+    literal separator shares one parser.
+    """
     if separator_chars:
         escaped = re.escape(separator_chars)
         return pattern(rf"[^\s{escaped}]+")
     else:
-        return pattern(r"\S+")
+        return _STR_PARSER
+
+
+# ``models`` imports this module, so :class:`ParsableModel` is resolved on first
+# use and then kept here instead of being re-imported for every field.
+_parsable_model_base: type | None = None
+
+
+def _get_parsable_model_base() -> type | None:
+    """Return the :class:`ParsableModel` class, importing it at most once."""
+    global _parsable_model_base
+    if _parsable_model_base is None:
+        try:
+            from .models import ParsableModel
+        except Exception:  # pragma: no cover
+            return None
+        _parsable_model_base = ParsableModel
+    return _parsable_model_base
 
 
 def is_parsable_model(field_type: Any) -> bool:
     """Return ``True`` if *field_type* is a :class:`ParsableModel` subclass."""
-    try:
-        from .models import ParsableModel
-    except Exception:  # pragma: no cover
+    if not isinstance(field_type, type):
         return False
 
-    if not isinstance(field_type, type):
+    base = _get_parsable_model_base()
+    if base is None:  # pragma: no cover
         return False
 
     try:
-        return issubclass(field_type, ParsableModel)
+        return issubclass(field_type, base)
     except TypeError:
         return False
 
 
 def is_optional_type(field_type: Any) -> Tuple[bool, Any | None]:
     """Detect ``Optional[T]`` / ``T | None`` annotations."""
-    origin = get_origin(field_type)
+    return _optional_inner(get_origin(field_type), get_args(field_type))
+
+
+def is_list_type(field_type: Any) -> Tuple[bool, Any | None]:
+    """Detect ``list[T]`` style annotations."""
+    return _list_element(field_type, get_origin(field_type), get_args(field_type))
+
+
+def is_union_type(field_type: Any) -> Tuple[bool, Tuple[Any, ...]]:
+    """Detect ``Union[A, B]`` / ``A | B`` annotations (excluding ``None``)."""
+    return _union_members(get_origin(field_type), get_args(field_type))
+
+
+# The helpers below take a precomputed ``get_origin``/``get_args`` pair so
+# that :func:`generate_field_parser` only introspects each annotation once.
+
+
+def _optional_inner(origin: Any, args: Tuple[Any, ...]) -> Tuple[bool, Any | None]:
     if origin not in (Union, UnionType):
         return False, None
 
-    args = get_args(field_type)
     non_none_args = [arg for arg in args if arg is not NoneType]
     none_count = len(args) - len(non_none_args)
 
@@ -93,12 +152,10 @@ def is_optional_type(field_type: Any) -> Tuple[bool, Any | None]:
     return False, None
 
 
-def is_list_type(field_type: Any) -> Tuple[bool, Any | None]:
-    """Detect ``list[T]`` style annotations."""
-    origin = get_origin(field_type)
-
+def _list_element(
+    field_type: Any, origin: Any, args: Tuple[Any, ...]
+) -> Tuple[bool, Any | None]:
     if origin is list or origin is List:
-        args = get_args(field_type)
         if not args:
             return True, None
         return True, args[0]
@@ -109,13 +166,13 @@ def is_list_type(field_type: Any) -> Tuple[bool, Any | None]:
     return False, None
 
 
-def is_union_type(field_type: Any) -> Tuple[bool, Tuple[Any, ...]]:
-    """Detect ``Union[A, B]`` / ``A | B`` annotations (excluding ``None``)."""
-    origin = get_origin(field_type)
+def _union_members(
+    origin: Any, args: Tuple[Any, ...]
+) -> Tuple[bool, Tuple[Any, ...]]:
     if origin not in (Union, UnionType):
         return False, ()
 
-    members = tuple(arg for arg in get_args(field_type) if arg is not NoneType)
+    members = tuple(arg for arg in args if arg is not NoneType)
     if not members:
         return False, ()
 
@@ -155,9 +212,11 @@ def generate_field_parser(
         TypeError: For malformed list types or invalid ParseField configuration.
     """
     metadata = get_parsefield_metadata(field_info)
+    origin = get_origin(field_type)
+    args = get_args(field_type)
 
     # Validate ``sep_by`` usage early
-    is_list, element_type = is_list_type(field_type)
+    is_list, element_type = _list_element(field_type, origin, args)
     if (
         metadata is not None
         and metadata.sep_by is not None
@@ -197,7 +256,7 @@ def generate_field_parser(
             return element_parser.sep_by(metadata.sep_by)
 
         # Default list behaviour: whitespace-separated elements
-        return element_parser.sep_by(whitespace())
+        return element_parser.sep_by(_DEFAULT_SEPARATOR)
 
     # At this point the field is not a list. Explicit ParseField configuration
     # can still override the type-driven logic.
@@ -221,15 +280,27 @@ def generate_field_parser(
         return nested_parser.map(_to_nested_model)
 
     # Optional types delegate to their inner annotation
-    is_opt, inner = is_optional_type(field_type)
+    is_opt, inner = _optional_inner(origin, args)
     if is_opt and inner is not None:
         field_type = inner
+        origin = get_origin(field_type)
+        args = get_args(field_type)
 
     # Union types are handled by generating parsers for each member
-    is_union, members = is_union_type(field_type)
+    is_union, members = _union_members(origin, args)
     if is_union:
         if not members:
             raise TypeError("Union types must specify at least one non-None member")
+        # ``Literal["A"] | Literal["B"]`` is the same as ``Literal["A", "B"]``
+        # and compiles to a single alternation below.
+        if all(get_origin(member) is Literal for member in members):
+            values = tuple(value for member in members for value in get_args(member))
+            return generate_field_parser(
+                Literal[values],  # type: ignore[valid-type]
+                field_info,
+                _ignore_sep_by=_ignore_sep_by,
+                _separator_chars=_separator_chars,
+            )
         parsers: List[Parser[Any]] = [
             generate_field_parser(
                 member,
@@ -239,33 +310,43 @@ def generate_field_parser(
             )
             for member in members
         ]
-        combined = parsers[0]
-        for alt in parsers[1:]:
-            combined = combined | alt
-        return combined
+        if len(parsers) == 1:
+            return parsers[0]
+        # A flat N-way ``alt`` tries members in declaration order without the
+        # nested frames of a ``|`` left-fold.
+        union_parser = alt(*parsers)
+        fused = _fuse_regex_alternatives(parsers, union_parser)
+        return union_parser if fused is None else fused
 
-    origin = get_origin(field_type) or field_type
+    if origin is None:
+        origin = field_type
 
     if origin is Literal:
-        literal_values = get_args(field_type)
+        literal_values = args
         if not literal_values:
             raise TypeError("Literal[...] must specify at least one value")
-        first, *rest = literal_values
-        if not isinstance(first, str) or any(not isinstance(v, str) for v in rest):
+        if any(not isinstance(v, str) for v in literal_values):
             raise NotImplementedError(
                 "Literal types are currently supported only for string values"
             )
-        lit_parser: Parser[str] = literal(first)
-        for value in rest:
-            lit_parser = lit_parser | literal(value)
-        return lit_parser  # type: ignore[return-value]
-
-    if origin is str:
+        if len(literal_values) == 1:
+            return literal(literal_values[0])
+        # One compiled alternation instead of a chain of ``|`` attempts. Longer
+        # values go first so a value that prefixes another cannot shadow it.
+        alternatives = sorted(literal_values, key=len, reverse=True)
+        source = "|".join(map(re.escape, alternatives))
+        # Report the allowed values rather than the regex source on failure,
+        # keeping the source so the alternation can still be fused.
+        described = pattern(source).desc(
+            "one of " + ", ".join(repr(value) for value in literal_values)
+        )
+        return _tag_regex(described, source)
+
+    if origin is str and _separator_chars:
         return _build_string_parser(_separator_chars)
-    if origin is int:
-        return integer()
-    if origin is float:
-        return float_num()
+    scalar_parser = _TYPE_DISPATCH.get(origin)
+    if scalar_parser is not None:
+        return scalar_parser
 
     raise NotImplementedError(
         f"Automatic parser generation not implemented for type {field_type!r}"
@@ -275,36 +356,82 @@ def generate_field_parser(
 def _get_field_separator(model_class: type["ParsableModel"]) -> Parser[Any]:
     """Return the parser to use between successive fields."""
     # Only use ParseConfig if defined directly on this class, not inherited
-    config = model_class.__dict__.get("ParseConfig", None)
-    separator: Parser[Any] | None = None
-    if config is not None:
-        separator = getattr(config, "field_separator", None)
-
-    if separator is None:
-        separator = whitespace()
-
-    return separator
+    separator: Parser[Any] | None = getattr(
+        get_parse_config(model_class), "field_separator", None
+    )
+    return _DEFAULT_SEPARATOR if separator is None else separator
 
 
 def _get_strict_optional(model_class: type["ParsableModel"]) -> bool:
     """Return the ``strict_optional`` flag for *model_class*."""
     # Only use ParseConfig if defined directly on this class, not inherited
-    config = model_class.__dict__.get("ParseConfig", None)
-    if config is None:
+    return getattr(get_parse_config(model_class), "strict_optional", True)
+
+
+def _get_packrat(model_class: type["ParsableModel"]) -> bool:
+    """Return the ``packrat`` flag for *model_class*."""
+    return getattr(get_parse_config(model_class), "packrat", False)
+
+
+# Packrat memo for the top-level parse in progress, keyed by
+# ``(memoized parser, index)``. :func:`packrat_scope` installs a fresh dict for
+# the duration of one parse; outside such a scope no memoization happens.
+_packrat_memo: ContextVar[Dict[Tuple[Parser[Any], int], Result] | None] = (
+    ContextVar("parsedantic_packrat_memo", default=None)
+)
+
+
+@contextmanager
+def packrat_scope() -> Iterator[None]:
+    """Give memoized parsers a fresh packrat memo for the enclosed parse."""
+    token = _packrat_memo.set({})
+    try:
+        yield
+    finally:
+        _packrat_memo.reset(token)
+
+
+def _memoize(parser: Parser[Any]) -> Parser[Any]:
+    """Return a packrat-style memoizing wrapper around *parser*.
+
+    Results are cached per input position for the duration of the enclosing
+    :meth:`ParsableModel.parse` call, so alternatives that retry *parser* at
+    the same index (e.g. a nested model shared by several ``Union`` members)
+    reuse the first result. The memo is discarded when that call returns.
+    """
+
+    @Parser
+    def memo_parser(stream: str, index: int) -> Result:
+        memo = _packrat_memo.get()
+        if memo is None:
+            return parser(stream, index)
+        key = (parser, index)
+        result = memo.get(key)
+        if result is None:
+            result = memo[key] = parser(stream, index)
+        return result
+
+    return memo_parser
+
+
+def _is_unresolved_annotation(annotation: Any) -> bool:
+    """Return ``True`` if *annotation* still contains a forward reference."""
+    if annotation is None or isinstance(annotation, (str, ForwardRef)):
         return True
-    return getattr(config, "strict_optional", True)
+    # Literal arguments are values, not annotations, so strings there are fine.
+    if get_origin(annotation) is Literal:
+        return False
+    return any(_is_unresolved_annotation(arg) for arg in get_args(annotation))
 
 
-def build_model_parser(model_class: type["ParsableModel"]) -> Parser[Dict[str, Any]]:
-    """Construct a parser that produces a mapping of field values."""
-    logger.debug("Building model parser for %s", model_class.__name__)
+def _resolve_type_hints(model_class: type["ParsableModel"]) -> Dict[str, Any]:
+    """Resolve annotations of *model_class* via :func:`typing.get_type_hints`.
 
-    # Resolve annotations, including forward references, against the model's
-    # module namespace. Unresolvable names should surface as a TypeError with
-    # a helpful message instead of leaking ForwardRef objects into the rest
-    # of the generator.
+    Unresolvable names surface as a :class:`TypeError` with a helpful message
+    instead of leaking ``ForwardRef`` objects into the rest of the generator.
+    """
     try:
-        type_hints = get_type_hints(model_class)
+        return get_type_hints(model_class)
     except NameError as exc:
         raise TypeError(
             f"Unresolved forward reference in annotations for "
@@ -313,12 +440,219 @@ def build_model_parser(model_class: type["ParsableModel"]) -> Parser[Dict[str, A
     except TypeError:
         # Some exotic model definitions may not cooperate with get_type_hints;
         # fall back to using FieldInfo.annotation directly.
-        type_hints = {}
+        return {}
+
+
+def _preceded_by(separator: Parser[Any], parser: Parser[Any]) -> Parser[Any]:
+    """Return a parser for *separator* followed by *parser*, keeping the latter.
+
+    Behaves like ``separator.then(parser)``, whose ``seq(...).combine(...)``
+    chain builds a list and routes through ``bind`` on every parse.
+    """
+
+    @Parser
+    def preceded_parser(stream: str, index: int) -> Result:
+        result = separator(stream, index)
+        if not result.status:
+            return result
+        return parser(stream, result.index).aggregate(result)
+
+    return preceded_parser
+
+
+def _optional(parser: Parser[Any]) -> Parser[Any]:
+    """Return a parser yielding ``None`` without consuming input if *parser* fails.
+
+    Behaves like ``parser.optional()``, which parsy builds as
+    ``times(0, 1).map(...)`` and so allocates a list per parse.
+    """
+
+    @Parser
+    def optional_parser(stream: str, index: int) -> Result:
+        result = parser(stream, index)
+        if result.status:
+            return result
+        return Result.success(index, None).aggregate(result)
+
+    return optional_parser
+
+
+def _regex_part(parser: Parser[Any]) -> Tuple[str, Any] | None:
+    """Return ``(source, convert)`` for a regex-backed *parser*, else ``None``.
+
+    Only group-free, flag-free sources qualify: embedding them in a larger
+    pattern must neither renumber groups they refer to nor let an inline flag
+    such as ``(?i)`` leak into the other parts (Python < 3.11 applies a
+    misplaced global flag to the whole pattern instead of rejecting it).
+    """
+    literal_value = getattr(parser, "_literal_value", None)
+    if isinstance(literal_value, str):
+        return re.escape(literal_value), None
+    source = getattr(parser, "_regex_source", None)
+    if not isinstance(source, str):
+        return None
+    try:
+        compiled = re.compile(source)
+    except re.error:
+        return None
+    if compiled.groups or compiled.flags & ~re.UNICODE:
+        return None
+    return source, getattr(parser, "_regex_convert", None)
+
+
+def _fuse_regex_fields(
+    field_names: Sequence[str],
+    field_parsers: Sequence[Parser[Any]],
+    separator: Parser[Any],
+    fallback: Parser[Dict[str, Any]],
+) -> Parser[Dict[str, Any]] | None:
+    """Return one compiled-regex parser for the whole field sequence.
+
+    Returns ``None`` unless the separator and every field parser are
+    regex-backed. Each part is wrapped in ``(?=(?P<g>...))(?P=g)``, the usual
+    atomic-group idiom, so it keeps the first match ``re.match`` would give
+    it and never backtracks into a neighbour. That mirrors how the parsy
+    sequence behaves. When the regex does not match, *fallback* re-runs the
+    parse so errors still point at the failing field.
+    """
+    separator_part = _regex_part(separator)
+    if separator_part is None or separator_part[1] is not None:
+        return None
+
+    pieces: List[str] = []
+    field_groups: List[Tuple[str, str, Any]] = []
+    for index, (name, parser) in enumerate(zip(field_names, field_parsers)):
+        part = _regex_part(parser)
+        if part is None:
+            return None
+        if index:
+            pieces.append(f"(?=(?P<_s{index}>{separator_part[0]}))(?P=_s{index})")
+        group = f"_f{index}"
+        pieces.append(f"(?=(?P<{group}>{part[0]}))(?P={group})")
+        field_groups.append((name, group, part[1]))
+
+    try:
+        compiled = re.compile("".join(pieces))
+    except re.error:
+        return None
+    match_at = compiled.match
+    fields = tuple(field_groups)
+
+    @Parser
+    def fused_parser(stream: str, index: int) -> Result:
+        match = match_at(stream, index)
+        if match is None:
+            return fallback(stream, index)
+        group_value = match.group
+        data: Dict[str, Any] = {}
+        for name, group, convert in fields:
+            value = group_value(group)
+            data[name] = value if convert is None else convert(value)
+        return Result.success(match.end(), data)
+
+    return fused_parser
+
+
+def _fuse_regex_alternatives(
+    parsers: Sequence[Parser[Any]], fallback: Parser[Any]
+) -> Parser[Any] | None:
+    """Return one compiled-regex parser trying *parsers* in order, or ``None``.
+
+    Only applies when every alternative is regex-backed. Regex alternation is
+    ordered just like ``alt``, so the first alternative that matches wins;
+    ``match.lastindex`` then picks its conversion. When nothing matches,
+    *fallback* re-runs the alternatives so the error lists each of them.
+    """
+    group_converters: List[Any] = [None]  # group numbers start at 1
+    pieces: List[str] = []
+    for parser in parsers:
+        part = _regex_part(parser)
+        if part is None:
+            return None
+        pieces.append(f"({part[0]})")
+        group_converters.append(part[1])
+
+    try:
+        compiled = re.compile("|".join(pieces))
+    except re.error:
+        return None
+    match_at = compiled.match
+    converters = tuple(group_converters)
+
+    @Parser
+    def fused_parser(stream: str, index: int) -> Result:
+        match = match_at(stream, index)
+        if match is None:
+            return fallback(stream, index)
+        value = match.group()
+        # Exactly one top-level group takes part in any match.
+        group = match.lastindex
+        assert group is not None
+        convert = converters[group]
+        if convert is not None:
+            value = convert(value)
+        return Result.success(match.end(), value)
+
+    return fused_parser
+
+
+def _lenient_optional(separator: Parser[Any], parser: Parser[Any]) -> Parser[Any]:
+    """Return the parser for a lenient ``Optional`` field after the first.
+
+    Behaves like ``_optional(_preceded_by(separator, parser | _GARBAGE_TOKEN))``
+    in a single step: after the separator, an unparseable token is consumed
+    as ``None``; without a separator the field is absent and yields ``None``.
+    """
+
+    @Parser
+    def lenient_parser(stream: str, index: int) -> Result:
+        result = separator(stream, index)
+        if result.status:
+            start = result.index
+            result = parser(stream, start).aggregate(result)
+            if result.status:
+                return result
+            result = _GARBAGE_TOKEN(stream, start).aggregate(result)
+            if result.status:
+                return result
+        return Result.success(index, None).aggregate(result)
+
+    return lenient_parser
+
+
+def _single_field_parser(name: str, parser: Parser[Any]) -> Parser[Dict[str, Any]]:
+    """Wrap the result of *parser* in a one-entry mapping under *name*.
+
+    Equivalent to ``seq(**{name: parser})`` without the per-parse loop, and
+    cheaper than ``parser.map(...)``, which routes through ``bind``.
+    """
+
+    @Parser
+    def single_field_parser(stream: str, index: int) -> Result:
+        result = parser(stream, index)
+        if not result.status:
+            return result
+        return Result.success(result.index, {name: result.value}).aggregate(result)
+
+    return single_field_parser
+
+
+def build_model_parser(model_class: type["ParsableModel"]) -> Parser[Dict[str, Any]]:
+    """Construct a parser that produces a mapping of field values."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Building model parser for %s", model_class.__name__)
 
     field_items: Sequence[Tuple[str, FieldInfo]] = tuple(
         model_class.model_fields.items()
     )
 
+    # Pydantic has normally resolved every annotation already; only fall back
+    # to ``get_type_hints`` when some field still carries a forward reference.
+    if any(_is_unresolved_annotation(info.annotation) for _, info in field_items):
+        type_hints = _resolve_type_hints(model_class)
+    else:
+        type_hints = {}
+
     if not field_items:
         return success({})
 
@@ -328,10 +662,13 @@ def build_model_parser(model_class: type["ParsableModel"]) -> Parser[Dict[str, A
     # Extract separator character(s) if it's a literal parser
     separator_chars = _extract_literal_string(separator)
 
-    # Cache parsers per distinct *base* type within this model
+    # Cache parsers per distinct *base* type within this model. Only fields
+    # without ParseField metadata share entries: a custom parser or pattern
+    # belongs to its own field, not to every field of the same type.
     type_parser_cache: Dict[Any, Parser[Any]] = {}
 
     field_names: List[str] = []
+    raw_parsers: List[Parser[Any]] = []
     base_parsers: List[Parser[Any]] = []
     optional_kinds: List[str] = []  # "none", "strict", "lenient"
 
@@ -347,19 +684,13 @@ def build_model_parser(model_class: type["ParsableModel"]) -> Parser[Dict[str, A
             base_type = field_type
             opt_kind = "none"
 
-        # When we have separator chars, we can't safely cache string parsers
-        if separator_chars and base_type is str:
-            base_parser = generate_field_parser(
-                base_type, field_info, _separator_chars=separator_chars
-            )
-        elif base_type in type_parser_cache:
-            base_parser = type_parser_cache[base_type]
-        else:
+        cacheable = get_parsefield_metadata(field_info) is None
+        base_parser = type_parser_cache.get(base_type) if cacheable else None
+        if base_parser is None:
             base_parser = generate_field_parser(
                 base_type, field_info, _separator_chars=separator_chars
             )
-            # Only cache if not separator-dependent
-            if not (separator_chars and base_type is str):
+            if cacheable:
                 type_parser_cache[base_type] = base_parser
 
         # Attach a human-friendly description so that parsy's ``expected`` set
@@ -367,17 +698,15 @@ def build_model_parser(model_class: type["ParsableModel"]) -> Parser[Dict[str, A
         field_parser = base_parser.desc(f"field '{name}'")
 
         field_names.append(name)
+        raw_parsers.append(base_parser)
         base_parsers.append(field_parser)
         optional_kinds.append(opt_kind)
 
-    # For lenient optional fields, garbage token yields None
-    garbage_token = pattern(r"\S+").result(None)
-
     combined_parsers: List[Parser[Any]] = []
 
     first_parser = base_parsers[0]
     if optional_kinds[0] == "lenient":
-        first_parser = first_parser.optional()
+        first_parser = _optional(first_parser)
     combined_parsers.append(first_parser)
 
     # Remaining fields are preceded by the separator
@@ -386,16 +715,26 @@ def build_model_parser(model_class: type["ParsableModel"]) -> Parser[Dict[str, A
         opt_kind = optional_kinds[index]
 
         if opt_kind == "lenient":
-            body = parser | garbage_token
-            combined = separator.then(body).optional()
+            combined = _lenient_optional(separator, parser)
         else:
-            combined = separator.then(parser)
+            combined = _preceded_by(separator, parser)
 
         combined_parsers.append(combined)
 
-    sequence_parser: Parser[Tuple[Any, ...]] = seq(*combined_parsers)  # type: ignore[arg-type]
-
-    def to_mapping(values: Iterable[Any]) -> Dict[str, Any]:
-        return dict(zip(field_names, values))
-
-    return sequence_parser.map(to_mapping)
+    if len(combined_parsers) == 1:
+        model_parser = _single_field_parser(field_names[0], combined_parsers[0])
+    else:
+        # Keyword ``seq`` writes each field result straight into the output
+        # dict, so no intermediate value list or ``dict(zip(...))`` is built.
+        model_parser = seq(**dict(zip(field_names, combined_parsers)))
+
+    # Without lenient optionals every field is required, so when all parts are
+    # regex-backed the whole sequence can run as one ``re.match``.
+    if "lenient" not in optional_kinds:
+        fused = _fuse_regex_fields(field_names, raw_parsers, separator, model_parser)
+        if fused is not None:
+            model_parser = fused
+
+    if _get_packrat(model_class):
+        model_parser = _memoize(model_parser)
+    return model_parser
@@ -1,19 +1,24 @@
 # src/parsedantic/models.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, Type, TypeVar, get_type_hints
+import os
+import threading
+from typing import Any, ClassVar, Dict, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 from parsy import Parser, ParseError as ParsyParseError, forward_declaration
-from pydantic import BaseModel, ConfigDict, Field  # , PydanticUndefined
-from pydantic.fields import FieldInfo
-from pydantic_core import PydanticUndefined
+from pydantic import BaseModel, ConfigDict
+from .config import get_parse_config
 from .errors import ParseError
-from .generator import build_model_parser
-from .parsers import whitespace
+from .generator import build_model_parser, packrat_scope
 
 SelfParsableModel = TypeVar("SelfParsableModel", bound="ParsableModel")
 
+# Built parsers are cached per model class unless the environment sets
+# ``PARSEDANTIC_PARSER_CACHE=0``. Disabling the cache trades CPU for memory:
+# every :meth:`ParsableModel.parse` call then rebuilds the model's parser.
+_PARSER_CACHE_ENABLED = os.environ.get("PARSEDANTIC_PARSER_CACHE", "1") != "0"
+
 
 class ParsableModel(BaseModel):
     """Base class for models that can be parsed from text using parsy.
@@ -30,7 +35,11 @@ class ParsableModel(BaseModel):
 
     # Cache of built parsers per concrete model class. We keep this private so
     # that callers interact only via :meth:`parse` or :meth:`_get_parser`.
-    _parser_cache: ClassVar[Dict[Type["ParsableModel"], Parser]] = {}
+    # Keys are weak so that dynamically created models can be garbage
+    # collected together with their parsers.
+    _parser_cache: ClassVar[WeakKeyDictionary[Type["ParsableModel"], Parser]] = (
+        WeakKeyDictionary()
+    )
 
     # Forward declaration registry for recursive models. When building a parser
     # for a model that references itself (directly or indirectly), we create a
@@ -38,6 +47,14 @@ class ParsableModel(BaseModel):
     # constructed.
     _forward_decls: ClassVar[Dict[Type["ParsableModel"], Parser]] = {}
 
+    # Serialises parser construction across threads. Re-entrant because
+    # building a model's parser builds the parsers of its nested models.
+    _parser_lock: ClassVar[threading.RLock] = threading.RLock()
+
+    # Set once any model with ``ParseConfig.packrat`` has been built, so that
+    # :meth:`parse` only pays for installing a packrat memo when one is used.
+    _packrat_in_use: ClassVar[bool] = False
+
     @classmethod
     def parse(cls: Type[SelfParsableModel], text: str) -> SelfParsableModel:
         """Parse *text* into a validated model instance.
@@ -55,7 +72,12 @@ class ParsableModel(BaseModel):
         """
         parser = cls._get_parser()
         try:
-            parsed_data = parser.parse(text)
+            if cls._packrat_in_use:
+                # Packrat memo entries live only for this call.
+                with packrat_scope():
+                    parsed_data = parser.parse(text)
+            else:
+                parsed_data = parser.parse(text)
         except (
             ParsyParseError
         ) as exc:  # pragma: no cover - behaviour via ParseError tests
@@ -66,41 +88,68 @@ class ParsableModel(BaseModel):
 
         return cls.model_validate(parsed_data)
 
+    @classmethod
+    def prebuild(cls) -> None:
+        """Build and cache the parser for *cls* now instead of on first use.
+
+        Parsers are otherwise built lazily by the first :meth:`parse` call.
+        Calling ``prebuild()`` at import time or from a startup hook moves that
+        cost out of the first request; nested models are built along the way.
+        It has no lasting effect when ``PARSEDANTIC_PARSER_CACHE=0``.
+        """
+        cls._get_parser()
+
     @classmethod
     def _get_parser(cls: Type[SelfParsableModel]) -> Parser[Any]:
         """Return a cached parser for *cls*, building it on first use.
 
         The parser is cached per concrete subclass to avoid the overhead of
         regenerating parsers on every :meth:`parse` call. This method is
-        thread-safe and emits debug logs indicating whether a cached parser
-        was used or a new one was built.
+        thread-safe: concurrent first calls build the parser exactly once.
+        With ``PARSEDANTIC_PARSER_CACHE=0`` a fresh parser is built on every
+        call instead.
 
         For recursive models we use :func:`parsy.forward_declaration` so that
         nested references to the same model (or mutually recursive models)
         can obtain a placeholder parser while the real parser is being built.
         """
-        # Use an explicit cache lookup so subclasses each get their own parser.
-        if cls in cls._parser_cache:
-            return cls._parser_cache[cls]
-
-        # If we already created a forward declaration for this class (because
-        # we are in the middle of building a recursive structure), return that
-        # placeholder immediately.
-        if cls in cls._forward_decls:
-            return cls._forward_decls[cls]
-
-        # Create a forward declaration and register it before building the
-        # actual parser so that recursive references can use it.
-        placeholder: Parser[Any] = forward_declaration()
-        cls._forward_decls[cls] = placeholder
-
-        parser = cls._build_parser()
-
-        # Once the real parser is available, fulfil the forward declaration and
-        # move the parser into the main cache.
-        placeholder.become(parser)
-        cls._parser_cache[cls] = parser
-        del cls._forward_decls[cls]
+        # Use an explicit per-class lookup so subclasses each get their own
+        # parser. A single ``get`` keeps the warm path to one dict probe.
+        parser = cls._parser_cache.get(cls)
+        if parser is not None:
+            return parser
+
+        with cls._parser_lock:
+            # Another thread may have finished the build while we waited.
+            parser = cls._parser_cache.get(cls)
+            if parser is not None:
+                return parser
+
+            # If we already created a forward declaration for this class
+            # (because this thread is in the middle of building a recursive
+            # structure), return that placeholder immediately.
+            if cls in cls._forward_decls:
+                return cls._forward_decls[cls]
+
+            # Create a forward declaration and register it before building the
+            # actual parser so that recursive references can use it.
+            placeholder: Parser[Any] = forward_declaration()
+            cls._forward_decls[cls] = placeholder
+
+            try:
+                parser = cls._build_parser()
+            finally:
+                # Never leave an unfulfilled placeholder behind, even when the
+                # build fails, or later calls would return it as the parser.
+                cls._forward_decls.pop(cls, None)
+
+            # Once the real parser is available, fulfil the forward declaration
+            # and move the parser into the main cache.
+            placeholder.become(parser)
+            if getattr(get_parse_config(cls), "packrat", False):
+                ParsableModel._packrat_in_use = True
+            if _PARSER_CACHE_ENABLED:
+                cls._parser_cache[cls] = parser
 
         return parser
 
@@ -115,128 +164,20 @@ class ParsableModel(BaseModel):
         return build_model_parser(cls)
 
     @classmethod
-    def clear_parser_cache(cls) -> None:
-        """Clear all cached parsers for all :class:`ParsableModel` subclasses."""
-        cls._parser_cache.clear()
-        cls._forward_decls.clear()
-
-
-@dataclass
-class ParseFieldMetadata:
-    """Configuration for a single field parsed from text.
-
-    This metadata is attached to Pydantic's :class:`FieldInfo` objects via
-    the ``json_schema_extra`` attribute so that the parser generator can
-    access it when building field parsers.
-    """
-
-    parser: Parser[Any] | None = None
-    pattern: str | None = None
-    sep_by: Parser[Any] | None = None
-
-
-class ParseField(Field):
-    """Custom field function that attaches parsing metadata.
-
-    Usage mirrors :func:`pydantic.Field` but accepts additional keyword
-    arguments:
-
-    * ``parser``: an explicit parsy :class:`Parser` to use for this field
-    * ``pattern``: a regular expression pattern string to match
-    * ``sep_by``: a parser used to separate list elements
-
-    The metadata is stored on the underlying :class:`FieldInfo` so that
-    :func:`parsedantic.generator.generate_field_parser` can inspect it.
-    """
+    def _clear_parser_cache(cls) -> None:
+        """Drop the cached parser for *cls* only.
 
-    def __init__(
-        self,
-        default: Any = PydanticUndefined,
-        *,
-        parser: Parser[Any] | None = None,
-        pattern: str | None = None,
-        sep_by: Parser[Any] | None = None,
-        **kwargs: Any,
-    ) -> None:
-        extra = kwargs.pop("json_schema_extra", {}) or {}
-        extra["parsefield_metadata"] = ParseFieldMetadata(
-            parser=parser,
-            pattern=pattern,
-            sep_by=sep_by,
-        )
-        super().__init__(default=default, json_schema_extra=extra, **kwargs)
-
-
-def get_parsefield_metadata(field_info: FieldInfo) -> ParseFieldMetadata | None:
-    """Extract :class:`ParseFieldMetadata` from a Pydantic :class:`FieldInfo`.
-
-    Returns ``None`` if no parsing metadata has been attached.
-    """
-    extra = field_info.json_schema_extra or {}
-    metadata = extra.get("parsefield_metadata")
-    if isinstance(metadata, ParseFieldMetadata):
-        return metadata
-    return None
-
-
-class ParseConfig(BaseModel):
-    """Configuration options that influence parser generation for a model.
-
-    Instances of this class are intended for use via the ``parse_config``
-    attribute on :class:`ParsableModel` subclasses. For example:
-
-    .. code-block:: python
-
-       class MyModel(ParsableModel):
-           x: int
-           y: int
-
-           parse_config = ParseConfig(field_separator=whitespace())
-
-    Attributes:
-        field_separator:
-            Optional parser that separates top-level fields in the model. When
-            provided, this parser is inserted between each field parser in the
-            generated model parser.
-        strict_optional:
-            When ``True`` (the default), optional fields still raise a
-            :class:`ParseError` if the underlying parser fails. When ``False``,
-            failures are treated as a missing value and the result becomes
-            ``None``.
-    """
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    field_separator: Parser | None = None
-    strict_optional: bool = True
-    whitespace: Parser | None = None
-
-
-def get_parse_config(model_cls: type[ParsableModel]) -> ParseConfig:
-    """Return the :class:`ParseConfig` associated with *model_cls*.
-
-    If the model defines a ``parse_config`` class attribute it is used
-    directly. Otherwise a default configuration is returned.
-    """
-    config = getattr(model_cls, "parse_config", None)
-    if isinstance(config, ParseConfig):
-        return config
-    return ParseConfig()
-
-
-def iter_model_fields(model_cls: type[ParsableModel]) -> Dict[str, FieldInfo]:
-    """Yield Pydantic :class:`FieldInfo` objects for all model fields.
+        Other subclasses keep their cached parsers; the next :meth:`parse` or
+        :meth:`_get_parser` call on *cls* rebuilds its parser from scratch.
+        """
+        with cls._parser_lock:
+            cls._parser_cache.pop(cls, None)
+            cls._forward_decls.pop(cls, None)
 
-    This helper is used by the parser generator to obtain field metadata
-    (including :class:`ParseFieldMetadata`) from the model class.
-    """
-    type_hints = get_type_hints(model_cls, include_extras=True)
-    fields: Dict[str, FieldInfo] = {}
-    for name, annotation in type_hints.items():
-        if name.startswith("_"):
-            continue
-        field_info = model_cls.model_fields.get(name)
-        if isinstance(field_info, FieldInfo):
-            fields[name] = field_info
-    return fields
+    @classmethod
+    def clear_parser_cache(cls) -> None:
+        """Clear all cached parsers for all :class:`ParsableModel` subclasses."""
+        with cls._parser_lock:
+            cls._parser_cache.clear()
+            cls._forward_decls.clear()
 
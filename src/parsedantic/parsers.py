@@ -7,9 +7,21 @@ These functions provide a small, well-typed surface over the underlying parsy
 APIs so that higher level code does not need to import parsy directly.
 """
 
-from typing import Any
+from typing import Any, Callable
 
-from parsy import Parser, any_char as _any_char, regex, string
+from parsy import Parser, Result, any_char as _any_char, regex
+
+
+def _tag_regex(
+    parser: Parser[Any], source: str, convert: Callable[[str], Any] | None = None
+) -> Parser[Any]:
+    """Record the regex behind *parser* so the generator can fuse sequences.
+
+    ``convert`` is the function the parser maps over the matched text, if any.
+    """
+    parser._regex_source = source  # type: ignore[attr-defined]
+    parser._regex_convert = convert  # type: ignore[attr-defined]
+    return parser
 
 
 def literal(text: str) -> Parser[str]:
@@ -19,7 +31,16 @@ def literal(text: str) -> Parser[str]:
         >>> literal("hello").parse("hello")
         'hello'
     """
-    parser = string(text)
+    length = len(text)
+
+    # ``str.startswith`` compares in place, whereas ``parsy.string`` slices the
+    # input and runs a transform on every attempt.
+    @Parser
+    def parser(stream: str, index: int) -> Result:
+        if stream.startswith(text, index):
+            return Result.success(index + length, text)
+        return Result.failure(index, text)
+
     # Store the literal value for extraction by generator code
     parser._literal_value = text  # type: ignore[attr-defined]
     return parser
@@ -32,7 +53,7 @@ def pattern(regex_pattern: str) -> Parser[str]:
         >>> pattern(r"\d+").parse("123")
         '123'
     """
-    return regex(regex_pattern)
+    return _tag_regex(regex(regex_pattern), regex_pattern)
 
 
 def integer() -> Parser[int]:
@@ -40,7 +61,8 @@ def integer() -> Parser[int]:
 
     The accepted pattern is ``-?\d+`` and the result is mapped to ``int``.
     """
-    return regex(r"-?\d+(?![.eE])").map(int)
+    integer_pattern = r"-?\d+(?![.eE])"
+    return _tag_regex(regex(integer_pattern).map(int), integer_pattern, int)
 
 
 def float_num() -> Parser[float]:
@@ -53,7 +75,7 @@ def float_num() -> Parser[float]:
     * scientific notation: ``"1e3"``, ``"-2.5E-4"``
     """
     float_pattern = r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
-    return regex(float_pattern).map(float)
+    return _tag_regex(regex(float_pattern).map(float), float_pattern, float)
 
 
 def word() -> Parser[str]:
@@ -61,12 +83,12 @@ def word() -> Parser[str]:
 
     The underlying pattern is ``[A-Za-z0-9_]+``.
     """
-    return regex(r"[A-Za-z0-9_]+")
+    return _tag_regex(regex(r"[A-Za-z0-9_]+"), r"[A-Za-z0-9_]+")
 
 
 def whitespace() -> Parser[str]:
     """Return a parser that parses one or more whitespace characters."""
-    return regex(r"\s+")
+    return _tag_regex(regex(r"\s+"), r"\s+")
 
 
 # Expose ``any_char`` as a ready-to-use parser instead of a factory so that it
@@ -10,10 +10,16 @@ These tests verify that model parsers are cached per subclass and that
 
 from typing import Any, ClassVar, Dict
 
+import gc
+import importlib
+import threading
 import time
+import weakref
 
+import pytest
 from parsy import Parser, string
 
+import parsedantic.models
 from parsedantic.generator import build_model_parser, generate_field_parser
 from parsedantic.models import ParsableModel
 
@@ -174,3 +180,110 @@ def test_cached_parser_enables_fast_repeated_parses() -> None:
 
     # Basic sanity: second_duration should be a positive float.
     assert second_duration > 0.0
+
+
+class SlowCounterModel(ParsableModel):
+    """Model whose parser construction is slow enough to overlap threads."""
+
+    value: str
+
+    _build_calls: ClassVar[int] = 0
+
+    @classmethod
+    def _build_parser(cls) -> Parser[Dict[str, Any]]:
+        cls._build_calls += 1
+        time.sleep(0.05)
+        return string("x").result({"value": "x"})
+
+
+def test_concurrent_get_parser_builds_once() -> None:
+    """Threads racing on the first ``_get_parser`` call share one build."""
+
+    SlowCounterModel._clear_parser_cache()
+    SlowCounterModel._build_calls = 0
+
+    results: list[Parser[Any]] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(SlowCounterModel._get_parser()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert SlowCounterModel._build_calls == 1
+    assert len(results) == 4
+    assert all(parser is results[0] for parser in results)
+
+
+def test_failed_build_does_not_leave_placeholder() -> None:
+    """A build error must not cache the unfinished forward declaration."""
+
+    class Unsupported(ParsableModel):
+        flag: bool
+
+    Unsupported._clear_parser_cache()
+    for _ in range(2):
+        with pytest.raises(NotImplementedError):
+            Unsupported._get_parser()
+
+
+def test_parser_cache_does_not_keep_dynamic_models_alive() -> None:
+    """Dropping a model class should release it and its cached parser."""
+
+    def make_model() -> weakref.ref[type[ParsableModel]]:
+        class Dynamic(ParsableModel):
+            x: int
+            y: str
+
+        Dynamic.parse("1 a")
+        assert Dynamic in ParsableModel._parser_cache
+        return weakref.ref(Dynamic)
+
+    model_ref = make_model()
+    gc.collect()
+
+    assert model_ref() is None
+
+
+def test_parser_cache_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With caching disabled every ``_get_parser`` call builds afresh."""
+
+    monkeypatch.setattr("parsedantic.models._PARSER_CACHE_ENABLED", False)
+    CounterModel._clear_parser_cache()
+    CounterModel._build_calls = 0
+
+    assert CounterModel.parse("x").value == "x"
+    assert CounterModel.parse("x").value == "x"
+
+    assert CounterModel._build_calls == 2
+    assert CounterModel not in ParsableModel._parser_cache
+
+
+def test_parser_cache_env_var_is_read_at_import(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``PARSEDANTIC_PARSER_CACHE=0`` disables the cache when models loads."""
+
+    original = dict(vars(parsedantic.models))
+    monkeypatch.setenv("PARSEDANTIC_PARSER_CACHE", "0")
+    try:
+        importlib.reload(parsedantic.models)
+        assert parsedantic.models._PARSER_CACHE_ENABLED is False
+    finally:
+        # Put back the original classes so later tests see the usual module.
+        vars(parsedantic.models).update(original)
+
+
+def test_prebuild_populates_parser_cache() -> None:
+    """``prebuild`` should build once so that ``parse`` reuses the parser."""
+
+    CounterModel._clear_parser_cache()
+    CounterModel._build_calls = 0
+
+    CounterModel.prebuild()
+    assert CounterModel._build_calls == 1
+
+    assert CounterModel.parse("x").value == "x"
+    assert CounterModel._build_calls == 1
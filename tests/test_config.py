@@ -1,7 +1,10 @@
 # tests/test_config.py
 from __future__ import annotations
 
-from parsedantic import ParseConfig, ParsableModel, literal, pattern
+from typing import Literal, Union
+
+from parsedantic import ParseConfig, ParseField, ParsableModel, integer, literal, pattern
+from parsedantic.config import get_parse_config
 
 
 def test_field_separator_literal() -> None:
@@ -99,3 +102,79 @@ def test_parseconfig_defaults() -> None:
     assert ParseConfig.field_separator is None
     assert ParseConfig.strict_optional is True
     assert ParseConfig.whitespace is None
+
+
+def test_get_parse_config_resolves_per_class() -> None:
+    class Configured(ParsableModel):
+        a: int
+
+        class ParseConfig:
+            strict_optional = False
+
+    class Plain(Configured):
+        b: int
+
+    class Override(Configured):
+        c: int
+
+        class ParseConfig:
+            strict_optional = True
+
+    assert get_parse_config(Configured) is Configured.__dict__["ParseConfig"]
+    assert get_parse_config(Plain) is ParseConfig
+    assert get_parse_config(Override) is Override.__dict__["ParseConfig"]
+
+
+def test_field_separator_change_applies_after_cache_clear() -> None:
+    class Model(ParsableModel):
+        a: int
+        b: int
+
+        class ParseConfig:
+            field_separator = literal(",")
+
+    assert Model.parse("1,2").b == 2
+
+    Model.ParseConfig.field_separator = literal(";")
+    Model._clear_parser_cache()
+
+    assert Model.parse("1;2").b == 2
+
+
+def test_packrat_reuses_nested_model_across_union_members() -> None:
+    calls = 0
+
+    def count(value: int) -> int:
+        nonlocal calls
+        calls += 1
+        return value
+
+    class Inner(ParsableModel):
+        x: int = ParseField(parser=integer().map(count))
+        y: str
+
+        class ParseConfig:
+            packrat = True
+
+    class WithA(ParsableModel):
+        inner: Inner
+        tag: Literal["a"]
+
+    class WithB(ParsableModel):
+        inner: Inner
+        tag: Literal["b"]
+
+    class Outer(ParsableModel):
+        item: Union[WithA, WithB]
+
+    result = Outer.parse("1 two b")
+    assert isinstance(result.item, WithB)
+    assert (result.item.inner.x, result.item.inner.y) == (1, "two")
+    # Both union members parse ``Inner`` at index 0; the second reuses the memo.
+    assert calls == 1
+
+    # The memo does not outlive the parse: the same string object parses anew.
+    text = "1 two b"
+    Outer.parse(text)
+    Outer.parse(text)
+    assert calls == 3
@@ -45,6 +45,20 @@ def test_parse_error_str_includes_location_and_context() -> None:
     assert "^" in message.splitlines()[-1]
 
 
+def test_parse_error_line_and_column_attributes() -> None:
+    err = ParseError(text="ab\ncd", index=4, expected="x")
+    assert (err.line, err.column) == (2, 2)
+    # Repeated access returns the same, cached position.
+    assert (err.line, err.column) == (2, 2)
+
+
+def test_parse_error_repr_includes_position() -> None:
+    err = ParseError(text="ab\ncd", index=4, expected="x")
+    assert repr(err) == (
+        "ParseError(text='ab\\ncd', index=4, expected='x', line=2, column=2)"
+    )
+
+
 @pytest.mark.parametrize(
     "text, index",
     [
@@ -139,3 +139,14 @@ def test_parsefield_pattern_and_sep_by_for_mixed_model() -> None:
     assert result.id == 10
     assert result.tags == ["foo", "bar", "baz"]
 
+
+def test_parsefield_parser_not_shared_with_plain_field_of_same_type() -> None:
+    """A custom parser should apply only to the field that declares it."""
+
+    class Model(ParsableModel):
+        code: int = ParseField(parser=pattern(r"\d\d").map(int))
+        count: int
+
+    result = Model.parse("12 345")
+    assert result.code == 12
+    assert result.count == 345
@@ -7,13 +7,21 @@ These tests exercise type-driven parser generation for simple field types and
 model-level parser construction.
 """
 
+from typing import Literal
+
 import pytest
-from parsy import Parser
+from parsy import ParseError as ParsyParseError, Parser
 from pydantic import Field as PydanticField
 
-from parsedantic.generator import build_model_parser, generate_field_parser
+from parsedantic.errors import ParseError
+from parsedantic.fields import ParseField
+from parsedantic.generator import (
+    _regex_part,
+    build_model_parser,
+    generate_field_parser,
+)
 from parsedantic.models import ParsableModel
-from parsedantic.parsers import literal
+from parsedantic.parsers import literal, pattern
 
 
 def test_generate_field_parser_for_str_int_float() -> None:
@@ -92,3 +100,81 @@ def test_build_model_parser_for_model_with_no_fields() -> None:
     assert result == {}
     instance = Empty.parse("")
     assert isinstance(instance, Empty)
+
+
+def test_build_model_parser_single_field_model() -> None:
+    """Single-field models should produce a one-entry mapping."""
+
+    class Single(ParsableModel):
+        value: int
+
+    parser = build_model_parser(Single)
+    assert parser.parse("7") == {"value": 7}
+
+    with pytest.raises(ParsyParseError):
+        parser.parse("seven")
+
+
+def test_generate_field_parser_literal_prefers_longest_value() -> None:
+    """Multi-value ``Literal`` fields should not stop at a shorter prefix."""
+    field_info = PydanticField()
+    parser = generate_field_parser(Literal["in", "inout", "out"], field_info)
+
+    assert parser.parse("inout") == "inout"
+    assert parser.parse("in") == "in"
+    assert parser.parse("out") == "out"
+    with pytest.raises(ParsyParseError) as exc_info:
+        parser.parse("up")
+    assert exc_info.value.expected == {"one of 'in', 'inout', 'out'"}
+    with pytest.raises(ParsyParseError):
+        parser.parse("in.out")
+
+
+def test_build_model_parser_fused_regex_matches_field_sequence() -> None:
+    """All-regex models should parse and fail exactly like the parsy sequence."""
+
+    class Record(ParsableModel):
+        count: int
+        ratio: float
+        name: str
+        kind: Literal["x", "yy"]
+
+    parser = build_model_parser(Record)
+    assert parser.parse("3 0.5 abc yy") == {
+        "count": 3,
+        "ratio": 0.5,
+        "name": "abc",
+        "kind": "yy",
+    }
+
+    with pytest.raises(ParseError) as exc_info:
+        Record.parse("3 0.5 abc zz")
+    assert exc_info.value.index == 10
+
+
+def test_build_model_parser_fused_regex_does_not_backtrack_between_fields() -> None:
+    """A greedy field must not give characters back to later fields."""
+
+    class Greedy(ParsableModel):
+        name: str
+        count: int
+
+        class ParseConfig:
+            field_separator = pattern(",?")
+
+    # ``str`` consumes "ab,12" whole, exactly as parsy's ``\S+`` would.
+    with pytest.raises(ParseError):
+        Greedy.parse("ab,12")
+
+
+def test_build_model_parser_inline_flag_pattern_is_not_fused() -> None:
+    """An inline ``(?i)`` must stay scoped to its own field."""
+
+    class Flagged(ParsableModel):
+        word: str = ParseField(pattern=r"(?i)abc")
+        kind: Literal["X"]
+
+    assert _regex_part(pattern(r"(?i)abc")) is None
+    assert Flagged.parse("ABC X").word == "ABC"
+    with pytest.raises(ParseError):
+        Flagged.parse("abc x")
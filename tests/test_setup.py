@@ -24,3 +24,12 @@ def test_dependencies_installed() -> None:
     parsy = importlib.import_module("parsy")
     assert pydantic is not None
     assert parsy is not None
+
+
+def test_public_api_names_resolve() -> None:
+    """Every name listed in ``parsedantic.__all__`` should be importable."""
+    module = importlib.import_module("parsedantic")
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+    assert sorted(module.__all__) == sorted(module._EXPORTS)
@@ -13,8 +13,13 @@ from typing import Literal, Union
 import pytest
 
 from parsedantic.errors import ParseError
-from parsedantic.generator import is_union_type
+from parsedantic.generator import (
+    _fuse_regex_alternatives,
+    _regex_part,
+    is_union_type,
+)
 from parsedantic.models import ParsableModel
+from parsedantic.parsers import literal, pattern
 
 
 def test_union_int_or_str_prefers_int_first() -> None:
@@ -64,6 +69,16 @@ def test_union_of_literals_matches_any_member() -> None:
         Model.parse("D")
 
 
+def test_union_of_literals_matches_longest_member() -> None:
+    """A Literal member that prefixes another should not shadow it."""
+
+    class Model(ParsableModel):
+        value: Literal["A"] | Literal["AB"]
+
+    assert Model.parse("AB").value == "AB"
+    assert Model.parse("A").value == "A"
+
+
 def test_union_multiple_primitive_types() -> None:
     """Union[int, float, str] should try each member in declaration order."""
 
@@ -142,3 +157,11 @@ def test_is_union_type_helper_excludes_none() -> None:
     assert is_union
     # Order of non-None members should be preserved.
     assert members == (int, str)
+
+
+def test_regex_union_fusion_skips_inline_flag_members() -> None:
+    """An inline-flag member must not make the other members case-insensitive."""
+    flagged = pattern(r"(?i)abc")
+
+    assert _regex_part(flagged) is None
+    assert _fuse_regex_alternatives([flagged, literal("X")], flagged) is None